@@ -37,7 +37,13 @@ from . import (
     hierarchy_duplicate,
     mirror_to_cursor,
     mirror_to_cursor_edit,
-    powerful_select
+    powerful_select,
+    selection_sets,
+    deduplicate_mesh_data,
+    transform_snapshot,
+    collapse_hierarchy,
+    export_hierarchies,
+    instance_repeated_subtrees,
 )
 
 modules = [
@@ -46,7 +52,13 @@ modules = [
     hierarchy_duplicate,
     mirror_to_cursor,
     mirror_to_cursor_edit,
-    powerful_select
+    powerful_select,
+    selection_sets,
+    deduplicate_mesh_data,
+    transform_snapshot,
+    collapse_hierarchy,
+    export_hierarchies,
+    instance_repeated_subtrees,
 ]
 
 def register():
@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+from .hierarchy_utils import find_roots, build_children_index, drop_nested_roots
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Collapse Hierarchy",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Collapse Hierarchy",
+    "category": "Object",
+    "description": "Merge every mesh of selected hierarchies into one mesh per hierarchy"
+}
+
+# Collection the original hierarchies are moved into when they are kept
+COLLAPSED_COLLECTION = "SmartScene_Collapsed"
+# Object types merged through their evaluated mesh when Apply Modifiers is on
+CONVERTIBLE_TYPES = {'CURVE', 'SURFACE', 'FONT'}
+
+def read_mesh_arrays(mesh, matrix, slot_map):
+    """Read one mesh in bulk and transform it into the merged object's space."""
+    nv, nl, npoly = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+
+    co = np.empty(nv * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    m = np.array(matrix, dtype=np.float32)
+    co = co.reshape(-1, 3) @ m[:3, :3].T + m[:3, 3]
+
+    loop_verts = np.empty(nl, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    starts = np.empty(npoly, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", starts)
+    totals = np.empty(npoly, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+    mat_index = np.empty(npoly, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", mat_index)
+    smooth = np.empty(npoly, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+
+    uv = np.zeros(nl * 2, dtype=np.float32)
+    if mesh.uv_layers.active:
+        mesh.uv_layers.active.data.foreach_get("uv", uv)
+    uv = uv.reshape(-1, 2)
+
+    # Negative scale flips winding; reverse each polygon's loops to keep normals
+    if matrix.determinant() < 0 and nl:
+        first = np.repeat(starts, totals)
+        last = np.repeat(starts + totals - 1, totals)
+        order = last - (np.arange(nl, dtype=np.int32) - first)
+        loop_verts, uv = loop_verts[order], uv[order]
+
+    if len(slot_map):
+        mat_index = slot_map[np.clip(mat_index, 0, len(slot_map) - 1)]
+    else:
+        mat_index = np.zeros(npoly, dtype=np.int32)
+
+    return co, loop_verts, starts, mat_index, smooth, uv
+
+def build_merged_mesh(name, parts, materials):
+    """Concatenate per-object arrays into one new mesh."""
+    co = np.concatenate([p[0] for p in parts]) if parts else np.empty((0, 3), np.float32)
+    v_offsets = np.cumsum([0] + [len(p[0]) for p in parts[:-1]])
+    l_offsets = np.cumsum([0] + [len(p[1]) for p in parts[:-1]])
+
+    loop_verts = np.concatenate([p[1] + off for p, off in zip(parts, v_offsets)])
+    starts = np.concatenate([p[2] + off for p, off in zip(parts, l_offsets)])
+    mat_index = np.concatenate([p[3] for p in parts])
+    smooth = np.concatenate([p[4] for p in parts])
+    uv = np.concatenate([p[5] for p in parts])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(len(starts))
+    mesh.polygons.foreach_set("loop_start", starts)
+    mesh.polygons.foreach_set("material_index", mat_index)
+    mesh.polygons.foreach_set("use_smooth", smooth)
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uv.ravel())
+    for mat in materials:
+        mesh.materials.append(mat)
+
+    mesh.update(calc_edges=True)
+    mesh.validate(clean_customdata=False)
+    return mesh
+
+def get_collapsed_collection(scene):
+    col = bpy.data.collections.get(COLLAPSED_COLLECTION)
+    if col is None:
+        col = bpy.data.collections.new(COLLAPSED_COLLECTION)
+        col.hide_viewport = True
+        col.hide_render = True
+    if col.name not in scene.collection.children:
+        scene.collection.children.link(col)
+    return col
+
+
+class OBJECT_OT_collapse_hierarchy(bpy.types.Operator):
+    """Merge all meshes of each selected hierarchy into a single mesh object"""
+    bl_idname = "object.collapse_hierarchy"
+    bl_label = "Collapse Hierarchy"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    apply_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers",
+        description="Merge the evaluated meshes instead of the base mesh data",
+        default=True
+    )
+
+    keep_original: bpy.props.BoolProperty(
+        name="Keep Original",
+        description=f"Move the original hierarchy into the hidden '{COLLAPSED_COLLECTION}' collection instead of deleting it",
+        default=True
+    )
+
+    def is_mergeable(self, obj):
+        if obj.type == 'MESH':
+            return True
+        # Curves and text only have a mesh once evaluated
+        return self.apply_modifiers and obj.type in CONVERTIBLE_TYPES
+
+    def collapse(self, context, root, children, depsgraph):
+        """Merge one hierarchy. Returns (merged, consumed): consumed are the
+        merged objects plus plain structural empties. Everything else (lights,
+        cameras, instancing empties...) stays in the scene, re-parented to the
+        merged object if its parent was consumed."""
+        hierarchy, stack = [], [root]
+        while stack:
+            obj = stack.pop()
+            hierarchy.append(obj)
+            stack.extend(reversed(children.get(obj, ())))
+        base = Matrix.Translation(root.matrix_world.translation)
+        base_inv = base.inverted()
+
+        materials, mat_lookup, parts, consumed, kept = [], {}, [], [], []
+        for obj in hierarchy:
+            if obj.type == 'EMPTY' and obj.instance_type == 'NONE':
+                consumed.append(obj)
+                continue
+            if not self.is_mergeable(obj):
+                kept.append(obj)
+                continue
+
+            # Slotless parts get an empty slot, not whichever material lands first
+            slot_map = []
+            for mat in [slot.material for slot in obj.material_slots] or [None]:
+                key = mat.name_full if mat else None
+                if key not in mat_lookup:
+                    mat_lookup[key] = len(materials)
+                    materials.append(mat)
+                slot_map.append(mat_lookup[key])
+            slot_map = np.array(slot_map, dtype=np.int32)
+
+            if self.apply_modifiers:
+                obj_eval = obj.evaluated_get(depsgraph)
+                mesh = obj_eval.to_mesh()
+                if mesh is not None:
+                    parts.append(read_mesh_arrays(mesh, base_inv @ obj.matrix_world, slot_map))
+                obj_eval.to_mesh_clear()
+            else:
+                parts.append(read_mesh_arrays(obj.data, base_inv @ obj.matrix_world, slot_map))
+            consumed.append(obj)
+
+        if not parts:
+            return None, []
+
+        merged = bpy.data.objects.new(f"{root.name}_MERGED", build_merged_mesh(f"{root.name}_MERGED", parts, materials))
+        collection = root.users_collection[0] if root.users_collection else context.scene.collection
+        collection.objects.link(merged)
+        merged.matrix_world = base
+
+        consumed_set = set(consumed)
+        for obj in kept:
+            if obj.parent in consumed_set:
+                world = obj.matrix_world.copy()
+                obj.parent = merged
+                # world = merged_world @ parent_inverse @ basis, keep basis untouched
+                obj.matrix_parent_inverse = base_inv @ world @ obj.matrix_basis.inverted_safe()
+        return merged, consumed
+
+    def execute(self, context):
+        sel = context.selected_objects
+        if not sel:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        depsgraph = context.evaluated_depsgraph_get()
+        children = build_children_index(bpy.data.objects)
+        merged_objs, originals = [], []
+        for root in drop_nested_roots(find_roots(sel)):
+            merged, consumed = self.collapse(context, root, children, depsgraph)
+            if merged:
+                merged_objs.append(merged)
+                originals.extend(consumed)
+
+        if not merged_objs:
+            self.report({'WARNING'}, "No meshes found in selected hierarchies")
+            return {'CANCELLED'}
+
+        if self.keep_original:
+            hidden = get_collapsed_collection(context.scene)
+            for obj in originals:
+                for col in obj.users_collection:
+                    col.objects.unlink(obj)
+                hidden.objects.link(obj)
+        else:
+            bpy.data.batch_remove(originals)
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in merged_objs:
+            obj.select_set(True)
+        context.view_layer.objects.active = merged_objs[0]
+
+        self.report({'INFO'}, f"Collapsed {len(originals)} object(s) into {len(merged_objs)} mesh(es)")
+        return {'FINISHED'}
+
+
+def menu_func(self, context):
+    if context.mode == 'OBJECT':
+        self.layout.operator(OBJECT_OT_collapse_hierarchy.bl_idname, icon='MOD_BOOLEAN')
+
+
+classes = (
+    OBJECT_OT_collapse_hierarchy,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
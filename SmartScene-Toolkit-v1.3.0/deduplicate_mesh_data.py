@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import bpy
+import hashlib
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from .hierarchy_utils import find_roots, collect_recursive
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Deduplicate Mesh Data",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Deduplicate Mesh Data",
+    "category": "Object",
+    "description": "Share one mesh data-block between identical meshes of the selected hierarchies"
+}
+
+# Attribute data type -> (foreach_get key, components, numpy dtype)
+ATTRIBUTE_LAYOUT = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+def meshes_with_vertex_groups():
+    """Meshes used by an object with vertex groups, whose deform weights matter."""
+    return {o.data for o in bpy.data.objects if o.type == 'MESH' and o.data and o.vertex_groups}
+
+def read_vertex_weights(mesh):
+    """Deform-vert data isn't exposed to foreach_get, so it's read per vertex."""
+    counts, groups, weights = [], [], []
+    for v in mesh.vertices:
+        counts.append(len(v.groups))
+        for g in v.groups:
+            groups.append(g.group)
+            weights.append(g.weight)
+    return [np.array(counts, dtype=np.int32), np.array(groups, dtype=np.int32), np.array(weights, dtype=np.float32)]
+
+def read_mesh_buffers(mesh, with_weights=False):
+    """Read positions, topology, every generic attribute (UVs, colors, creases,
+    sharp flags...), custom normals, material slots and optionally vertex
+    group weights of a mesh in bulk.
+
+    Runs on the main thread (bpy is not thread safe); only the returned
+    buffers are handed to the hashing threads. Returns None if the mesh has
+    data the fingerprint can't cover, so it is never treated as a duplicate.
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+
+    buffers = [co, loop_verts, loop_starts, edges]
+    layout = []
+    for attr in sorted(mesh.attributes, key=lambda a: a.name):
+        spec = ATTRIBUTE_LAYOUT.get(attr.data_type)
+        if spec is None:
+            return None
+        key, components, dtype = spec
+        data = np.empty(len(attr.data) * components, dtype=dtype)
+        attr.data.foreach_get(key, data)
+        layout.append(f"{attr.name}:{attr.domain}:{attr.data_type}")
+        buffers.append(data)
+
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        buffers.append(normals)
+    if with_weights:
+        buffers.extend(read_vertex_weights(mesh))
+
+    slots = "|".join(m.name_full if m else "" for m in mesh.materials)
+    header = f"{slots}#{','.join(layout)}#{mesh.has_custom_normals}#{with_weights}"
+    return header, buffers
+
+def hash_buffers(header, buffers):
+    """Fingerprint the buffers; hashlib releases the GIL so this runs in parallel."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(header.encode())
+    for buf in buffers:
+        h.update(len(buf).to_bytes(8, "little"))
+        h.update(buf.tobytes())
+    return h.hexdigest()
+
+def estimate_mesh_bytes(mesh):
+    """Rough size of a mesh's core arrays, used to report memory saved."""
+    n_uv = len(mesh.uv_layers)
+    return (len(mesh.vertices) * 12
+            + len(mesh.edges) * 8
+            + len(mesh.loops) * (8 + 8 * n_uv)
+            + len(mesh.polygons) * 12)
+
+def find_duplicate_meshes(meshes):
+    """Group meshes by geometry fingerprint.
+
+    Returns a list of (master, [duplicates]) for every group with repeats.
+    """
+    candidates = [m for m in meshes if m.library is None and m.shape_keys is None and not m.is_editmode]
+    weighted = meshes_with_vertex_groups()
+
+    hashed, futures = [], []
+    with ThreadPoolExecutor() as pool:
+        for m in candidates:
+            read = read_mesh_buffers(m, m in weighted)
+            if read is None:
+                continue
+            hashed.append(m)
+            futures.append(pool.submit(hash_buffers, *read))
+        digests = [f.result() for f in futures]
+
+    groups = {}
+    for mesh, digest in zip(hashed, digests):
+        groups.setdefault(digest, []).append(mesh)
+
+    result = []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        group.sort(key=lambda m: (-m.users, m.name))
+        result.append((group[0], group[1:]))
+    return result
+
+
+class OBJECT_OT_deduplicate_mesh_data(bpy.types.Operator):
+    """Remap identical meshes of the selected hierarchies to one shared data-block"""
+    bl_idname = "object.deduplicate_mesh_data"
+    bl_label = "Deduplicate Mesh Data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report duplicate meshes, do not remap or remove anything",
+        default=False
+    )
+
+    def find_groups(self, context):
+        objs = collect_recursive(find_roots(context.selected_objects))
+        meshes = {o.data for o in objs if o.type == 'MESH' and o.data}
+        return find_duplicate_meshes(meshes)
+
+    def invoke(self, context, event):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+        self._groups = self.find_groups(context)
+        if not self._groups:
+            self.report({'INFO'}, "No duplicate meshes found")
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+        groups = getattr(self, "_groups", None)
+        if not groups:
+            layout.prop(self, "dry_run")
+            return
+        saved = sum(estimate_mesh_bytes(d) for _master, dups in groups for d in dups)
+        layout.label(text=f"{len(groups)} group(s), ~{saved / 1024 ** 2:.2f} MB to free")
+        col = layout.column(align=True)
+        for master, dups in groups[:20]:
+            col.label(text=f"{master.name}  ←  {len(dups)} duplicate(s)", icon='MESH_DATA')
+        if len(groups) > 20:
+            col.label(text=f"... and {len(groups) - 20} more")
+        layout.prop(self, "dry_run")
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        # Groups from invoke are only valid for the first execute; redo runs
+        # after an undo, which invalidates the stored Mesh references.
+        groups = getattr(self, "_groups", None)
+        self._groups = None
+        if groups is None:
+            groups = self.find_groups(context)
+        n_dups = sum(len(dups) for _master, dups in groups)
+        saved = sum(estimate_mesh_bytes(d) for _master, dups in groups for d in dups)
+
+        if self.dry_run:
+            listing = "; ".join(f"{master.name} ← {len(dups)}" for master, dups in groups[:10])
+            if len(groups) > 10:
+                listing += f"; ... and {len(groups) - 10} more"
+            self.report({'INFO'}, f"Dry run: {n_dups} duplicate mesh(es) in {len(groups)} group(s), "
+                                  f"~{saved / 1024 ** 2:.2f} MB: {listing}")
+            return {'FINISHED'}
+
+        orphans = []
+        for master, dups in groups:
+            for dup in dups:
+                dup.user_remap(master)
+                if dup.users == 0:
+                    orphans.append(dup)
+        if orphans:
+            bpy.data.batch_remove(orphans)
+
+        self.report({'INFO'}, f"Remapped {n_dups} mesh(es) in {len(groups)} group(s), "
+                              f"freed ~{saved / 1024 ** 2:.2f} MB")
+        return {'FINISHED'}
+
+
+def menu_func(self, context):
+    if context.mode == 'OBJECT':
+        self.layout.operator(OBJECT_OT_deduplicate_mesh_data.bl_idname, icon='MESH_DATA')
+
+
+classes = (
+    OBJECT_OT_deduplicate_mesh_data,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import os
+import bpy
+from .hierarchy_utils import find_roots, build_children_index, collect_recursive, drop_nested_roots
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Export Hierarchies to .blend Files",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Export Hierarchies to .blend Files",
+    "category": "Object",
+    "description": "Write each selected hierarchy to its own .blend file without touching the open file"
+}
+
+def unique_filepath(directory, name, taken, overwrite):
+    """Return <directory>/<name>.blend, numbered if the name is already taken."""
+    stem = bpy.path.clean_name(name)
+    path = os.path.join(directory, f"{stem}.blend")
+    n = 1
+    while path in taken or (not overwrite and os.path.exists(path)):
+        path = os.path.join(directory, f"{stem}_{n:03d}.blend")
+        n += 1
+    taken.add(path)
+    return path
+
+def iter_hierarchy_exports(roots, directory, children, overwrite=False, mark_as_asset=True, compress=False):
+    """Write every root's hierarchy to its own .blend file, one at a time.
+
+    Each hierarchy is wrapped in a temporary collection (not linked to any
+    scene) and written with bpy.data.libraries.write, which pulls in the
+    mesh, material and image data-blocks it depends on. The open file is
+    never saved or reloaded. children is a parent -> children map built
+    once by the caller (hierarchy_utils.build_children_index). Yields
+    (index, root_name, filepath) after each file so callers can report
+    progress or stop early.
+    """
+    taken = set()
+    for index, root in enumerate(roots):
+        root_name = root.name
+        filepath = unique_filepath(directory, root_name, taken, overwrite)
+
+        col = bpy.data.collections.new(root_name)
+        # Detach the root from a parent outside the hierarchy while writing,
+        # otherwise libraries.write pulls the whole parent chain into the file.
+        parent = root.parent
+        if parent:
+            parent_inverse = root.matrix_parent_inverse.copy()
+            basis = root.matrix_basis.copy()
+            world = root.matrix_world.copy()
+            root.parent = None
+            root.matrix_basis = world
+        try:
+            for obj in collect_recursive([root], children):
+                col.objects.link(obj)
+            if mark_as_asset:
+                col.asset_mark()
+            bpy.data.libraries.write(filepath, {col}, path_remap='RELATIVE_ALL', fake_user=True, compress=compress)
+        finally:
+            bpy.data.collections.remove(col)
+            if parent:
+                root.parent = parent
+                root.matrix_parent_inverse = parent_inverse
+                root.matrix_basis = basis
+
+        yield index, root_name, filepath
+
+
+class OBJECT_OT_export_hierarchies_blend(bpy.types.Operator):
+    """Export each selected hierarchy to its own .blend file"""
+    bl_idname = "object.export_hierarchies_blend"
+    bl_label = "Export Hierarchies to .blend Files"
+    bl_options = {'REGISTER'}
+
+    directory: bpy.props.StringProperty(name="Directory", subtype='DIR_PATH')
+    filter_folder: bpy.props.BoolProperty(default=True, options={'HIDDEN'})
+
+    overwrite: bpy.props.BoolProperty(
+        name="Overwrite",
+        description="Overwrite existing files instead of numbering new ones",
+        default=False
+    )
+
+    mark_as_asset: bpy.props.BoolProperty(
+        name="Mark as Asset",
+        description="Mark the exported hierarchy collection as an asset",
+        default=True
+    )
+
+    compress: bpy.props.BoolProperty(name="Compress", default=False)
+
+    def invoke(self, context, event):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        sel = context.selected_objects
+        if not sel:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        directory = bpy.path.abspath(self.directory)
+        if not os.path.isdir(directory):
+            self.report({'ERROR'}, f"Directory not found: {directory}")
+            return {'CANCELLED'}
+
+        roots = drop_nested_roots(find_roots(sel))
+        children = build_children_index(bpy.data.objects)
+        wm = context.window_manager
+        wm.progress_begin(0, len(roots))
+        written = 0
+        try:
+            for index, _root_name, _filepath in iter_hierarchy_exports(
+                    roots, directory, children, self.overwrite, self.mark_as_asset, self.compress):
+                written += 1
+                wm.progress_update(index + 1)
+        except (OSError, RuntimeError) as e:
+            self.report({'ERROR'}, f"Export stopped after {written} file(s): {e}")
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+
+        self.report({'INFO'}, f"Exported {written} hierarchy file(s) to {directory}")
+        return {'FINISHED'}
+
+
+def menu_func(self, context):
+    if context.mode == 'OBJECT':
+        self.layout.operator(OBJECT_OT_export_hierarchies_blend.bl_idname, icon='EXPORT')
+
+
+classes = (
+    OBJECT_OT_export_hierarchies_blend,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
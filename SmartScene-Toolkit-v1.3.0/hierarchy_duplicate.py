@@ -19,6 +19,7 @@
 # ***** END GPL LICENSE BLOCK ****
 
 import bpy
+from .naming import NameAllocator, split_side, template_error
 
 bl_info = {
     "name": "🪄 SmartScene Toolkit - Hierarchy Duplicate (multi-parent)",
@@ -36,6 +37,12 @@ class OBJECT_OT_DuplicateHierarchyMulti(bpy.types.Operator):
     bl_label = "Duplicate Hierarchies"
     bl_options = {'REGISTER', 'UNDO'}
 
+    name_template: bpy.props.StringProperty(
+        name="Name Template",
+        description="Name for each copy. Fields: {name}, {root}, {side}, {n}",
+        default="{name}{side}.{n:03d}"
+    )
+
     def tag_and_unhide_children(self, parent):
         """Recursively select children & remember hidden state."""
         for child in parent.children:
@@ -60,6 +67,12 @@ class OBJECT_OT_DuplicateHierarchyMulti(bpy.types.Operator):
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
 
+        error = template_error(self.name_template)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        names = NameAllocator(bpy.data.objects, self.name_template)
+
         sel_set = set(sel_objs)
         root_parents = []
         for obj in sel_objs:
@@ -71,8 +84,10 @@ class OBJECT_OT_DuplicateHierarchyMulti(bpy.types.Operator):
         
         target_collection = context.active_object.users_collection[0] if context.active_object else context.scene.collection
 
-        def duplicate_hierarchy(obj, collection):
+        def duplicate_hierarchy(obj, collection, root_name):
             obj_copy = obj.copy()
+            stem, side = split_side(obj.name)
+            names.rename(obj_copy, name=stem, root=root_name, side=side)
             if obj.data:
                 obj_copy.data = obj.data.copy()
             collection.objects.link(obj_copy)
@@ -80,7 +95,7 @@ class OBJECT_OT_DuplicateHierarchyMulti(bpy.types.Operator):
             obj_copy.select_set(True)
 
             for child in obj.children:
-                child_copy = duplicate_hierarchy(child, collection)
+                child_copy = duplicate_hierarchy(child, collection, root_name)
                 child_copy.parent = obj_copy
                 child_copy.matrix_parent_inverse = child.matrix_parent_inverse.copy()
 
@@ -91,7 +106,7 @@ class OBJECT_OT_DuplicateHierarchyMulti(bpy.types.Operator):
 
         new_roots = []
         for root in root_parents:
-            new_root = duplicate_hierarchy(root, target_collection)
+            new_root = duplicate_hierarchy(root, target_collection, split_side(root.name)[0])
             new_roots.append(new_root)
 
     
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+"""Hierarchy helpers shared by operators that walk whole selected hierarchies."""
+
+import bpy
+
+def find_roots(objs):
+    """Topmost objects of objs (walking up while the parent is also in objs),
+    in selection order and without duplicates."""
+    sel = set(objs)
+    roots, seen = [], set()
+    for o in objs:
+        p = o
+        while p.parent and p.parent in sel:
+            p = p.parent
+        if p not in seen:
+            seen.add(p)
+            roots.append(p)
+    return roots
+
+def build_children_index(objs):
+    """One pass parent -> children map, instead of scanning per obj.children."""
+    children = {}
+    for o in objs:
+        if o.parent:
+            children.setdefault(o.parent, []).append(o)
+    return children
+
+def collect_recursive(objs, children=None):
+    """objs plus all their descendants, walked through one children index
+    (built from bpy.data.objects when not given, like children_recursive)
+    instead of one children_recursive scan per object."""
+    if children is None:
+        children = build_children_index(bpy.data.objects)
+    res = set()
+    stack = list(objs)
+    while stack:
+        o = stack.pop()
+        if o in res:
+            continue
+        res.add(o)
+        stack.extend(children.get(o, ()))
+    return res
+
+def drop_nested_roots(roots):
+    """Drop roots that sit inside another root's hierarchy (through an
+    unselected object), so no hierarchy is processed twice."""
+    root_set = set(roots)
+    result = []
+    for r in roots:
+        p = r.parent
+        while p and p not in root_set:
+            p = p.parent
+        if p is None:
+            result.append(r)
+    return result
@@ -0,0 +1,351 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import bpy
+import hashlib
+from mathutils import Matrix
+from .deduplicate_mesh_data import read_mesh_buffers, hash_buffers, meshes_with_vertex_groups
+from .hierarchy_utils import find_roots, build_children_index, drop_nested_roots
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Instance Repeated Subtrees",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Instance Repeated Subtrees",
+    "category": "Object",
+    "description": "Find structurally identical sub-hierarchies and replace repeats with collection instances"
+}
+
+# Collection holding the master copies; excluded from the view layer so only
+# the instances are drawn.
+MASTERS_COLLECTION = "SmartScene_Instance_Masters"
+
+# Modifier/constraint properties that don't change the result (UI state, per-copy ids)
+IGNORED_SETTINGS = {
+    "rna_type", "persistent_uid", "is_active", "active", "show_expanded",
+    "is_override_data", "is_override_data_local", "is_override_data_editable",
+}
+
+def geometry_fingerprint(data, weighted):
+    """Same mesh fingerprint as Deduplicate Mesh Data (positions, topology,
+    all attributes, custom normals, weights). Meshes it can't cover fall
+    back to data-block identity, so they only match themselves."""
+    if not isinstance(data, bpy.types.Mesh):
+        return data.name_full
+    read = read_mesh_buffers(data, data in weighted)
+    if read is None:
+        return data.name_full
+    return hash_buffers(*read)
+
+def settings_key(struct, depth=2):
+    """Every setting of a modifier or constraint as a string: ID pointers by
+    name, nested settings structs (e.g. cloth settings) up to depth levels."""
+    parts = []
+    for prop in struct.bl_rna.properties:
+        ident = prop.identifier
+        if ident in IGNORED_SETTINGS or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, ident, None)
+        if prop.type == 'POINTER':
+            if isinstance(value, bpy.types.ID):
+                value = value.name_full
+            elif value is not None:
+                if depth == 0:
+                    continue
+                value = settings_key(value, depth - 1)
+        elif isinstance(value, set):
+            value = sorted(value)
+        elif prop.type in {'BOOLEAN', 'INT', 'FLOAT'} and prop.array_length:
+            value = [tuple(v) if hasattr(v, "__len__") else v for v in value]
+        parts.append(f"{ident}={value!r}")
+    return ";".join(parts)
+
+def behaviour_key(obj):
+    """Everything besides data and children that instancing would replace
+    with the master's: parenting mode, modifiers, constraints, animation."""
+    parts = [obj.parent_type, obj.parent_bone]
+    parts += [m.type + ":" + settings_key(m) for m in obj.modifiers]
+    parts += [c.type + ":" + settings_key(c) for c in obj.constraints]
+    anim = obj.animation_data
+    if anim:
+        parts.append(anim.action.name_full if anim.action else "")
+        slot = getattr(anim, "action_slot", None)
+        parts.append(slot.identifier if slot else "")
+        if anim.drivers:
+            # Drivers can read anything in the file; a driven object only matches itself
+            parts.append(obj.name_full)
+    return "|".join(parts)
+
+class SubtreeIndex:
+    """Bottom-up (Merkle) hashes of every subtree under the given roots.
+
+    A node's hash covers its type, data fingerprint, material slots,
+    parenting mode, modifier and constraint settings, animation and the
+    sorted (relative transform, hash) pairs of its children, so two subtrees
+    hash equal when they are structurally identical up to the root's own
+    placement. Every object is visited once.
+    """
+
+    def __init__(self, roots, all_objects, match_geometry=True, precision=4):
+        self.match_geometry = match_geometry
+        self.precision = precision
+        self.hash = {}
+        self.size = {}
+        self.count = {}
+        self._data_keys = {}
+        self._weighted = meshes_with_vertex_groups() if match_geometry else set()
+
+        self.children = build_children_index(all_objects)
+
+        nodes = []
+        stack = list(roots)
+        while stack:
+            o = stack.pop()
+            nodes.append(o)
+            stack.extend(self.children.setdefault(o, []))
+
+        # Reverse pre-order visits every child before its parent
+        for o in reversed(nodes):
+            self.hash[o] = self.node_hash(o)
+            self.size[o] = 1 + sum(self.size[c] for c in self.children[o])
+            self.count[self.hash[o]] = self.count.get(self.hash[o], 0) + 1
+
+    def data_key(self, obj):
+        if obj.data is None:
+            return ""
+        key = self._data_keys.get(obj.data)
+        if key is None:
+            key = geometry_fingerprint(obj.data, self._weighted) if self.match_geometry else obj.data.name_full
+            self._data_keys[obj.data] = key
+        return key
+
+    def relative_key(self, parent, child):
+        rel = parent.matrix_world.inverted_safe() @ child.matrix_world
+        return tuple(round(v, self.precision) + 0.0 for row in rel for v in row)
+
+    def node_hash(self, obj):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(obj.type.encode())
+        h.update(self.data_key(obj).encode())
+        h.update("|".join(s.material.name_full if s.material else "" for s in obj.material_slots).encode())
+        h.update(behaviour_key(obj).encode())
+        for rel, child_hash in sorted((self.relative_key(obj, c), self.hash[c]) for c in self.children[obj]):
+            h.update(repr(rel).encode())
+            h.update(child_hash.encode())
+        return h.hexdigest()
+
+    def subtree(self, obj):
+        result, stack = [], [obj]
+        while stack:
+            o = stack.pop()
+            result.append(o)
+            stack.extend(self.children[o])
+        return result
+
+    def repeated_groups(self, roots, min_objects=2):
+        """Group the largest repeated subtrees; nested repeats are not split out."""
+        groups = {}
+        stack = list(roots)
+        while stack:
+            o = stack.pop()
+            h = self.hash[o]
+            if self.count[h] > 1 and self.size[o] >= min_objects:
+                groups.setdefault(h, []).append(o)
+            else:
+                stack.extend(self.children[o])
+        return [sorted(members, key=lambda o: o.name) for members in groups.values() if len(members) > 1]
+
+def get_masters_collection(context):
+    holder = bpy.data.collections.get(MASTERS_COLLECTION)
+    if holder is None:
+        holder = bpy.data.collections.new(MASTERS_COLLECTION)
+    if holder.name not in context.scene.collection.children:
+        context.scene.collection.children.link(holder)
+    layer_col = context.view_layer.layer_collection.children.get(holder.name)
+    if layer_col:
+        layer_col.exclude = True
+    return holder
+
+def instance_groups(context, index, groups):
+    """Replace every group with collection instances of its first member.
+
+    All matrices are read before anything is relinked or removed; repeats
+    are deleted with one batch_remove at the end.
+    """
+    holder = get_masters_collection(context)
+    to_remove, instances = [], []
+
+    for members in groups:
+        master = members[0]
+        master_world_inv = master.matrix_world.inverted_safe()
+        plans = []
+        for m in members:
+            target_col = m.users_collection[0] if m.users_collection else context.scene.collection
+            parent_world = m.parent.matrix_world.copy() if m.parent else Matrix.Identity(4)
+            plans.append((m.name, m.parent, parent_world, target_col, m.matrix_world @ master_world_inv))
+
+        col = bpy.data.collections.new(f"{master.name}_INST")
+        holder.children.link(col)
+        master_objs = index.subtree(master)
+        master_world = master.matrix_world.copy()
+        for o in master_objs:
+            for c in o.users_collection:
+                c.objects.unlink(o)
+            col.objects.link(o)
+        # Make the master self-contained so the instance source doesn't follow its old parent
+        master.parent = None
+        master.matrix_basis = master_world
+
+        for name, parent, parent_world, target_col, world in plans:
+            empty = bpy.data.objects.new(f"{name}_INST", None)
+            empty.instance_type = 'COLLECTION'
+            empty.instance_collection = col
+            target_col.objects.link(empty)
+            if parent:
+                empty.parent = parent
+            empty.matrix_basis = parent_world.inverted_safe() @ world
+            instances.append(empty)
+
+        for m in members[1:]:
+            to_remove.extend(index.subtree(m))
+
+    data = {o.data for o in to_remove if o.data}
+    bpy.data.batch_remove(to_remove)
+    bpy.data.batch_remove([d for d in data if d.users == 0])
+    return instances, len(to_remove)
+
+
+class OBJECT_OT_instance_repeated_subtrees(bpy.types.Operator):
+    """Find identical sub-hierarchies in the selection and replace repeats with collection instances"""
+    bl_idname = "object.instance_repeated_subtrees"
+    bl_label = "Instance Repeated Subtrees"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    match: bpy.props.EnumProperty(
+        name="Match Data By",
+        items=[
+            ('GEOMETRY', "Geometry", "Meshes with equal positions and topology match, even as separate copies"),
+            ('IDENTITY', "Data-Block", "Only objects sharing the same data-block match"),
+        ],
+        default='GEOMETRY'
+    )
+
+    precision: bpy.props.IntProperty(
+        name="Precision",
+        description="Decimal places relative transforms are rounded to before hashing",
+        default=4,
+        min=1,
+        max=8
+    )
+
+    min_objects: bpy.props.IntProperty(
+        name="Minimum Objects",
+        description="Smallest subtree size worth instancing",
+        default=2,
+        min=1
+    )
+
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report repeated subtrees, do not convert them",
+        default=False
+    )
+
+    def find_groups(self, context):
+        roots = drop_nested_roots(find_roots(context.selected_objects))
+        index = SubtreeIndex(roots, context.scene.objects, self.match == 'GEOMETRY', self.precision)
+        return index, index.repeated_groups(roots, self.min_objects)
+
+    def invoke(self, context, event):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+        self._index, self._groups = self.find_groups(context)
+        if not self._groups:
+            self.report({'INFO'}, "No repeated subtrees found")
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+        groups = getattr(self, "_groups", None)
+        if not groups:
+            layout.prop(self, "dry_run")
+            return
+        layout.label(text=f"{len(groups)} repeated subtree group(s)")
+        col = layout.column(align=True)
+        for members in groups[:20]:
+            col.label(text=f"{members[0].name}  ×{len(members)}", icon='OUTLINER_OB_GROUP_INSTANCE')
+        if len(groups) > 20:
+            col.label(text=f"... and {len(groups) - 20} more")
+        layout.prop(self, "dry_run")
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        # Groups from invoke are only valid for the first execute; redo runs
+        # after an undo (stale Object references) and possibly new settings.
+        index, groups = getattr(self, "_index", None), getattr(self, "_groups", None)
+        self._index = self._groups = None
+        if groups is None:
+            index, groups = self.find_groups(context)
+        if self.dry_run:
+            listing = "; ".join(f"{members[0].name} ← {len(members) - 1}" for members in groups[:10])
+            if len(groups) > 10:
+                listing += f"; ... and {len(groups) - 10} more"
+            self.report({'INFO'}, f"Dry run: {len(groups)} group(s), "
+                                  f"{sum(len(m) - 1 for m in groups)} repeat(s): {listing}")
+            return {'FINISHED'}
+
+        instances, removed = instance_groups(context, index, groups)
+        for o in context.selected_objects:
+            o.select_set(False)
+        for o in instances:
+            o.select_set(True)
+
+        self.report({'INFO'}, f"Created {len(instances)} instance(s) in {len(groups)} group(s), removed {removed} object(s)")
+        return {'FINISHED'}
+
+
+def menu_func(self, context):
+    if context.mode == 'OBJECT':
+        self.layout.operator(OBJECT_OT_instance_repeated_subtrees.bl_idname, icon='OUTLINER_OB_GROUP_INSTANCE')
+
+
+classes = (
+    OBJECT_OT_instance_repeated_subtrees,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
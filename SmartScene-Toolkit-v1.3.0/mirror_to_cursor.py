@@ -20,6 +20,9 @@
 
 import bpy
 from mathutils import Matrix
+from mathutils.kdtree import KDTree
+from .naming import NameAllocator, split_side, flip_side, side_from_offset, template_error
+from .hierarchy_utils import find_roots, collect_recursive
 
 bl_info = {
     "name": "🪄 SmartScene Toolkit - Mirror-Duplicate to Cursor (Plane Style)",
@@ -31,23 +34,6 @@ bl_info = {
     "description": "Mirror-duplicate selected hierarchies across the 3D-cursor XY/YZ/ZX plane"
 }
 
-def collect_recursive(objs):
-    res = set()
-    for o in objs:
-        res.add(o)
-        res.update(o.children_recursive)
-    return res
-
-def find_roots(objs):
-    roots, sel = [], set(objs)
-    for o in objs:
-        p = o
-        while p.parent and p.parent in sel:
-            p = p.parent
-        if p not in roots:
-            roots.append(p)
-    return roots
-
 def make_mirror_matrix(cursor_vec, axis):
     idx = {'X': 0, 'Y': 1, 'Z': 2}[axis]
     scale = Matrix.Identity(4)
@@ -56,6 +42,57 @@ def make_mirror_matrix(cursor_vec, axis):
     T_to_ori = Matrix.Translation(-cursor_vec)
     return T_back @ scale @ T_to_ori
 
+def mesh_signature(obj):
+    """Cheap per-object key used to decide whether two objects can be mirror pairs."""
+    if obj.type == 'MESH' and obj.data:
+        return (obj.type, len(obj.data.vertices))
+    return (obj.type, None)
+
+def is_counterpart(a, b):
+    """Two objects are counterparts if they share data or have the same vertex count."""
+    if a.data is not None and a.data == b.data:
+        return True
+    return mesh_signature(a) == mesh_signature(b)
+
+def find_mirror_pairs(objs, cursor_vec, axis, tolerance):
+    """Match objects on the positive side of the cursor plane to their mirrored
+    counterpart on the negative side.
+
+    One KD-tree over world-space origins keeps this O(N log N).
+    Returns (pairs, unmatched) where pairs is a list of (positive, negative).
+    """
+    idx = {'X': 0, 'Y': 1, 'Z': 2}[axis]
+    M_mirror = make_mirror_matrix(cursor_vec, axis)
+
+    objs = list(objs)
+    positive, negative = [], []
+    for o in objs:
+        offset = o.matrix_world.translation[idx] - cursor_vec[idx]
+        if offset > tolerance:
+            positive.append(o)
+        elif offset < -tolerance:
+            negative.append(o)
+        # Objects lying on the plane are their own counterpart
+
+    kd = KDTree(len(negative))
+    for i, o in enumerate(negative):
+        kd.insert(o.matrix_world.translation, i)
+    kd.balance()
+
+    pairs, claimed = [], set()
+    for o in positive:
+        target = M_mirror @ o.matrix_world.translation
+        for _co, i, _dist in sorted(kd.find_range(target, tolerance), key=lambda hit: hit[2]):
+            if i in claimed or not is_counterpart(o, negative[i]):
+                continue
+            claimed.add(i)
+            pairs.append((o, negative[i]))
+            break
+
+    matched = {o for pair in pairs for o in pair}
+    unmatched = [o for o in positive + negative if o not in matched]
+    return pairs, unmatched
+
 
 class OBJECT_OT_mirror_dup_cursor(bpy.types.Operator):
     """Mirror-duplicate selected hierarchies/objects across the 3D-cursor XY/YZ/ZX plane"""
@@ -73,44 +110,234 @@ class OBJECT_OT_mirror_dup_cursor(bpy.types.Operator):
         default='X'
     )
 
-    def duplicate_hierarchy(self, obj, collection):
+    name_template: bpy.props.StringProperty(
+        name="Name Template",
+        description="Name for each mirrored copy. Fields: {name}, {root}, {side}, {n}. "
+                    "{side} is the flipped .L/.R suffix of the source",
+        default="{name}{side}"
+    )
+
+    interactive: bpy.props.BoolProperty(
+        name="Interactive",
+        description="Duplicate once, then switch the mirror plane with X/Y/Z before confirming",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    def mirrored_side(self, obj, cursor):
+        """Flip an existing .L/.R suffix, or derive one from the mirrored X position.
+        Mirroring across the XY or ZX plane doesn't change the side."""
+        stem, side = split_side(obj.name)
+        if self.axis != 'X':
+            return stem, side
+        if side:
+            return stem, flip_side(side)
+        return stem, side_from_offset(cursor.x - obj.matrix_world.translation.x)
+
+    def duplicate_hierarchy(self, obj, collection, names, root_name, cursor, copies):
         obj_copy = obj.copy()
+        stem, side = self.mirrored_side(obj, cursor)
+        names.rename(obj_copy, name=stem, root=root_name, side=side)
+        copies.append((obj, obj_copy, root_name))
         if obj.data:
             obj_copy.data = obj.data.copy()
         collection.objects.link(obj_copy)
         obj_copy.matrix_world = obj.matrix_world.copy()
 
         for child in obj.children:
-            child_copy = self.duplicate_hierarchy(child, collection)
+            child_copy = self.duplicate_hierarchy(child, collection, names, root_name, cursor, copies)
             child_copy.parent = obj_copy
             child_copy.matrix_parent_inverse = child.matrix_parent_inverse.copy()
 
         return obj_copy
     
 
+    def duplicate_roots(self, context):
+        """Deep-duplicate the selected hierarchies; returns the duplicated roots.
+        (source, copy, root_name) of every copy is kept in self._copies."""
+        roots = find_roots(context.selected_objects)
+        target_collection = context.active_object.users_collection[0] if context.active_object else context.scene.collection
+
+        cursor = context.scene.cursor.location.copy()
+        names = NameAllocator(bpy.data.objects, self.name_template)
+        root_dups = []
+        self._copies = []
+        for root in roots:
+            root_name = self.mirrored_side(root, cursor)[0]
+            dup_root = self.duplicate_hierarchy(root, target_collection, names, root_name, cursor, self._copies)
+            root_dups.append(dup_root)
+        return root_dups
+
+    def rename_copies(self, cursor):
+        """Re-derive the copies' names after the plane changed in interactive mode."""
+        names = NameAllocator(bpy.data.objects, self.name_template)
+        for source, copy, root_name in self._copies:
+            stem, side = self.mirrored_side(source, cursor)
+            names.rename(copy, name=stem, root=root_name, side=side)
+
+    def apply_mirror(self, root_dups, base_matrices, cursor):
+        """Place the duplicated roots at their mirror for the current axis.
+
+        Only the root matrices are rewritten, so switching axis is cheap.
+        """
+        M_mirror = make_mirror_matrix(cursor, self.axis)
+        for obj, base in zip(root_dups, base_matrices):
+            obj.matrix_world = M_mirror @ base
+
     def execute(self, context):
-        sel = context.selected_objects
-        if not sel:
+        if not context.selected_objects:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
 
-        roots = find_roots(sel)
-        all_targets = collect_recursive(roots)
+        error = template_error(self.name_template)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
 
+        root_dups = self.duplicate_roots(context)
+        base_matrices = [obj.matrix_world.copy() for obj in root_dups]
+        self.apply_mirror(root_dups, base_matrices, context.scene.cursor.location.copy())
 
-        target_collection = context.active_object.users_collection[0] if context.active_object else context.scene.collection
+        return {'FINISHED'}
 
-        root_dups = []
-        for root in roots:
-            dup_root = self.duplicate_hierarchy(root, target_collection)
-            root_dups.append(dup_root)
+    # Interactive mode: duplicate once, then switch the plane live with X/Y/Z
+    # instead of paying for a full re-duplication on every redo-panel change.
+    def invoke(self, context, event):
+        if not self.interactive:
+            return self.execute(context)
+
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        error = template_error(self.name_template)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
 
+        self._root_dups = self.duplicate_roots(context)
+        self._named_axis = self.axis
+        self._base_matrices = [obj.matrix_world.copy() for obj in self._root_dups]
+        self._cursor = context.scene.cursor.location.copy()
+        self.apply_mirror(self._root_dups, self._base_matrices, self._cursor)
+        self.update_header(context)
 
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def update_header(self, context):
+        if context.area:
+            context.area.header_text_set(
+                f"Mirror Plane: flip {self.axis}   |   X/Y/Z: switch plane   "
+                f"LMB/Enter: confirm   RMB/Esc: cancel"
+            )
+
+    def modal(self, context, event):
+        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            return {'PASS_THROUGH'}
+
+        if event.value != 'PRESS':
+            return {'RUNNING_MODAL'}
+
+        if event.type in {'X', 'Y', 'Z'}:
+            self.axis = event.type
+            self.apply_mirror(self._root_dups, self._base_matrices, self._cursor)
+            self.update_header(context)
+            return {'RUNNING_MODAL'}
+
+        if event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER', 'SPACE'}:
+            # Names depend on the plane; assign them once for the confirmed one
+            if self.axis != self._named_axis:
+                self.rename_copies(self._cursor)
+            if context.area:
+                context.area.header_text_set(None)
+            return {'FINISHED'}
+
+        if event.type in {'RIGHTMOUSE', 'ESC'}:
+            dups = collect_recursive(self._root_dups)
+            data = {o.data for o in dups if o.data and o.data.users == 1}
+            bpy.data.batch_remove(list(dups) + list(data))
+            if context.area:
+                context.area.header_text_set(None)
+            return {'CANCELLED'}
+
+        return {'RUNNING_MODAL'}
+
+
+class OBJECT_OT_mirror_sync_cursor(bpy.types.Operator):
+    """Pair selected hierarchies with their counterparts across the 3D-cursor plane, then report or sync them"""
+    bl_idname = "object.mirror_sync_cursor"
+    bl_label = "Sync Mirror Pairs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    axis: bpy.props.EnumProperty(
+        name="Mirror Plane",
+        items=[
+            ('X', "Across YZ (flip X)", "Mirror across YZ plane"),
+            ('Y', "Across ZX (flip Y)", "Mirror across ZX plane"),
+            ('Z', "Across XY (flip Z)", "Mirror across XY plane"),
+        ],
+        default='X'
+    )
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('REPORT', "Select Unmatched", "Select objects without a counterpart"),
+            ('POS_TO_NEG', "Sync + to -", "Copy transforms from the positive side to the negative side"),
+            ('NEG_TO_POS', "Sync - to +", "Copy transforms from the negative side to the positive side"),
+        ],
+        default='REPORT'
+    )
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Maximum distance between a mirrored origin and its counterpart",
+        default=0.001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    def execute(self, context):
+        sel = context.selected_objects
+        if not sel:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        all_targets = collect_recursive(find_roots(sel))
         cursor = context.scene.cursor.location.copy()
+        pairs, unmatched = find_mirror_pairs(all_targets, cursor, self.axis, self.tolerance)
+
+        if self.action == 'REPORT':
+            for o in sel:
+                o.select_set(False)
+            for o in unmatched:
+                o.select_set(True)
+            self.report({'INFO'}, f"Matched {len(pairs)} pair(s), {len(unmatched)} unmatched")
+            return {'FINISHED'}
+
+        if self.action == 'NEG_TO_POS':
+            pairs = [(neg, pos) for pos, neg in pairs]
+
+        # Resolve new world matrices first, then write local matrices parent-first
+        # so each child sees its parent's updated world matrix.
         M_mirror = make_mirror_matrix(cursor, self.axis)
-        for obj in root_dups:
-            obj.matrix_world = M_mirror @ obj.matrix_world
+        new_world = {dst: M_mirror @ src.matrix_world for src, dst in pairs}
 
+        def depth(o):
+            d = 0
+            while o.parent:
+                o, d = o.parent, d + 1
+            return d
+
+        for dst in sorted(new_world, key=depth):
+            if dst.parent:
+                parent_world = new_world.get(dst.parent, dst.parent.matrix_world)
+                dst.matrix_basis = (parent_world @ dst.matrix_parent_inverse).inverted() @ new_world[dst]
+            else:
+                dst.matrix_basis = new_world[dst]
+
+        self.report({'INFO'}, f"Synced {len(pairs)} pair(s), {len(unmatched)} unmatched")
         return {'FINISHED'}
 
 
@@ -133,9 +360,15 @@ class OBJECT_MT_mirror_dup_submenu(bpy.types.Menu):
             op = layout.operator(OBJECT_OT_mirror_dup_cursor.bl_idname, text=label, icon='MOD_MIRROR')
             op.axis = axis
 
+        layout.separator()
+        for axis, label in mirror_items:
+            op = layout.operator(OBJECT_OT_mirror_sync_cursor.bl_idname, text=f"Sync Pairs {label}", icon='MOD_MIRROR')
+            op.axis = axis
+
 
 classes = (
     OBJECT_OT_mirror_dup_cursor,
+    OBJECT_OT_mirror_sync_cursor,
     OBJECT_MT_mirror_dup_submenu,
 )
 
@@ -151,6 +384,7 @@ def register():
     if kc:
         km = kc.keymaps.new(name='Object Mode', space_type='EMPTY')
         kmi = km.keymap_items.new("object.mirror_duplicate_cursor", type='M', value='PRESS', ctrl=True, shift=True)
+        kmi.properties.interactive = True
         addon_keymaps.append((km, kmi))
 
 def unregister():
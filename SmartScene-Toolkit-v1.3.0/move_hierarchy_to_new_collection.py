@@ -19,7 +19,9 @@
 # ***** END GPL LICENSE BLOCK ****
 
 import bpy
-from bpy.props import StringProperty
+from bpy.app.handlers import persistent
+from bpy.props import StringProperty, FloatProperty, EnumProperty
+from mathutils import Vector
 
 bl_info = {
     "name": "🪄 SmartScene Toolkit - Move Hierarchy to New Collection",
@@ -31,6 +33,10 @@ bl_info = {
     "description": "Move selected objects and their full hierarchy into a new collection",
 }
 
+# Custom property marking collections this operator files hierarchies into, so other tools
+# (e.g. distance culling) can tell filed hierarchy collections apart.
+HIERARCHY_COLLECTION_TAG = "smartscene_hierarchy_collection"
+
 ## Utility functions
 def collect_recursive(objs):
     """Return a set with every object in objs and all their descendants."""
@@ -104,6 +110,7 @@ class OBJECT_OT_move_hierarchy_to_collection(bpy.types.Operator):
             new_col = bpy.data.collections.new(new_name)
             parent_col = find_common_ancestor_collection(sel)
             parent_col.children.link(new_col)
+        new_col[HIERARCHY_COLLECTION_TAG] = True
 
 
         all_objs = collect_recursive(sel)
@@ -118,6 +125,381 @@ class OBJECT_OT_move_hierarchy_to_collection(bpy.types.Operator):
         return {"FINISHED"}
 
 
+## Distance culling of hierarchy collections
+# Bounds are cached per collection and only dropped when a member object
+# moves; visibility flags are written only when the near/far answer flips.
+_cull_state = {
+    "running": False,
+    "reference": 'CURSOR',
+    "distance": 50.0,
+    "mode": 'HIDE',
+    "interval": 0.5,
+}
+_bounds_cache = {}  # collection name -> (center, radius)
+_culled = {}        # collection name -> True while this tool has it culled
+_original_flags = {}  # collection name -> user's flag value before we culled it
+_collection_parents = {}  # collection name -> parent collection names, built lazily
+
+
+def collection_bounds(col):
+    """Return (center, radius) of a bounding sphere around all objects in col."""
+    cached = _bounds_cache.get(col.name)
+    if cached is not None:
+        return cached
+
+    lo = Vector((float("inf"),) * 3)
+    hi = Vector((float("-inf"),) * 3)
+    found = False
+    for obj in col.all_objects:
+        mw = obj.matrix_world
+        for corner in obj.bound_box:
+            co = mw @ Vector(corner)
+            lo.x, lo.y, lo.z = min(lo.x, co.x), min(lo.y, co.y), min(lo.z, co.z)
+            hi.x, hi.y, hi.z = max(hi.x, co.x), max(hi.y, co.y), max(hi.z, co.z)
+            found = True
+
+    bounds = ((lo + hi) * 0.5, (hi - lo).length * 0.5) if found else None
+    _bounds_cache[col.name] = bounds
+    return bounds
+
+
+def find_layer_collections(layer_col, result=None):
+    """Map collection name -> LayerCollection for a view layer tree."""
+    if result is None:
+        result = {}
+    result[layer_col.collection.name] = layer_col
+    for child in layer_col.children:
+        find_layer_collections(child, result)
+    return result
+
+
+def cull_flag():
+    return "exclude" if _cull_state["mode"] == 'EXCLUDE' else "hide_viewport"
+
+
+def set_culled(layer_col, far):
+    """Cull a collection, remembering the user's flag, or give that flag back."""
+    name = layer_col.collection.name
+    flag = cull_flag()
+    if far:
+        _original_flags.setdefault(name, getattr(layer_col, flag))
+        setattr(layer_col, flag, True)
+    else:
+        setattr(layer_col, flag, _original_flags.pop(name, False))
+
+
+def cull_reference_point(scene):
+    if _cull_state["reference"] == 'CAMERA' and scene.camera:
+        return scene.camera.matrix_world.translation
+    return scene.cursor.location
+
+
+def cull_tick():
+    """Timer callback: re-evaluate distances and flip only changed collections."""
+    if not _cull_state["running"]:
+        return None
+
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    if scene is None or view_layer is None:
+        return _cull_state["interval"]
+
+    ref = cull_reference_point(scene)
+    threshold = _cull_state["distance"]
+    layer_cols = None
+
+    for col in bpy.data.collections:
+        if not col.get(HIERARCHY_COLLECTION_TAG):
+            continue
+        bounds = collection_bounds(col)
+        if bounds is None:
+            continue
+        center, radius = bounds
+        far = (center - ref).length - radius > threshold
+        # Collections we never culled are left alone while they stay near
+        if _culled.get(col.name, False) == far:
+            continue
+
+        if layer_cols is None:
+            layer_cols = find_layer_collections(view_layer.layer_collection)
+        layer_col = layer_cols.get(col.name)
+        if layer_col is None:
+            continue
+        set_culled(layer_col, far)
+        _culled[col.name] = far
+
+    return _cull_state["interval"]
+
+
+def collection_parents():
+    """Map collection name -> names of collections that contain it."""
+    if not _collection_parents:
+        for parent in bpy.data.collections:
+            for child in parent.children:
+                _collection_parents.setdefault(child.name, []).append(parent.name)
+    return _collection_parents
+
+
+def drop_bounds(name):
+    """Drop cached bounds of a collection and every collection containing it,
+    since bounds are computed over all_objects."""
+    parents = collection_parents()
+    stack, seen = [name], set()
+    while stack:
+        n = stack.pop()
+        if n in seen:
+            continue
+        seen.add(n)
+        _bounds_cache.pop(n, None)
+        stack.extend(parents.get(n, ()))
+
+
+def invalidate_bounds(scene, depsgraph):
+    """Drop cached bounds of collections whose objects moved or changed."""
+    if not _cull_state["running"]:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Collection):
+            # Children may have been linked or unlinked
+            _collection_parents.clear()
+            drop_bounds(id_data.name)
+        elif isinstance(id_data, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry):
+            for col in id_data.users_collection:
+                drop_bounds(col.name)
+
+
+def remove_cull_callbacks():
+    _cull_state["running"] = False
+    if bpy.app.timers.is_registered(cull_tick):
+        bpy.app.timers.unregister(cull_tick)
+    if invalidate_bounds in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_bounds)
+
+
+def clear_cull_state():
+    _culled.clear()
+    _original_flags.clear()
+    _bounds_cache.clear()
+    _collection_parents.clear()
+
+
+def stop_culling():
+    """Stop the timer and restore visibility of every collection we culled."""
+    remove_cull_callbacks()
+    view_layer = bpy.context.view_layer
+    if view_layer is not None:
+        layer_cols = find_layer_collections(view_layer.layer_collection)
+        for name, far in _culled.items():
+            if far and name in layer_cols:
+                set_culled(layer_cols[name], False)
+    clear_cull_state()
+
+
+@persistent
+def reset_culling_on_load(*_args):
+    """load_pre handler: the timer and depsgraph handler don't survive a file
+    load, so stop culling and forget the old file's culled collections rather
+    than applying them to same-named collections in the new one."""
+    remove_cull_callbacks()
+    clear_cull_state()
+
+
+class OBJECT_OT_toggle_hierarchy_collection_culling(bpy.types.Operator):
+    """Hide or exclude hierarchy collections that are far from the 3D cursor or active camera"""
+    bl_idname = "object.toggle_hierarchy_collection_culling"
+    bl_label = "Toggle Distance Culling"
+    bl_options = {"REGISTER"}
+
+    reference: EnumProperty(
+        name="Reference",
+        items=[
+            ('CURSOR', "3D Cursor", "Measure distance from the 3D cursor"),
+            ('CAMERA', "Active Camera", "Measure distance from the scene camera"),
+        ],
+        default='CURSOR',
+    )
+
+    distance: FloatProperty(
+        name="Distance",
+        description="Collections whose bounds are farther than this are culled",
+        default=50.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ('HIDE', "Hide in Viewport", "Toggle the view layer visibility of the collection"),
+            ('EXCLUDE', "Exclude", "Exclude the collection from the view layer"),
+        ],
+        default='HIDE',
+    )
+
+    interval: FloatProperty(
+        name="Update Interval",
+        description="Seconds between distance checks",
+        default=0.5,
+        min=0.05,
+        subtype='TIME',
+        unit='TIME',
+    )
+
+    def invoke(self, context, event):
+        if _cull_state["running"]:
+            return self.execute(context)
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if _cull_state["running"]:
+            stop_culling()
+            self.report({"INFO"}, "Distance culling stopped")
+            return {"FINISHED"}
+
+        _cull_state.update(
+            running=True,
+            reference=self.reference,
+            distance=self.distance,
+            mode=self.mode,
+            interval=self.interval,
+        )
+        if invalidate_bounds not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(invalidate_bounds)
+        bpy.app.timers.register(cull_tick, first_interval=0.0)
+        self.report({"INFO"}, "Distance culling started")
+        return {"FINISHED"}
+
+
+## Watch mode: keep hierarchies filed in their root's collection
+# Only objects reported by the depsgraph whose parent differs from the last
+# known one are looked at, so the cost follows the edit, not the scene size.
+_known_parents = {}   # object session_uid -> parent session_uid (None if unparented)
+_known_children = {}  # parent session_uid -> set of child session_uids
+_known_objects = {}   # object session_uid -> Object
+
+
+def hierarchy_collection(obj):
+    """Return the tagged collection the root of obj's hierarchy is filed in."""
+    root = obj
+    while root.parent:
+        root = root.parent
+    return next((c for c in root.users_collection if c.get(HIERARCHY_COLLECTION_TAG)), None)
+
+
+def remember_parent(obj):
+    """Record obj's current parent; return True if it differs from the known one."""
+    uid = obj.session_uid
+    parent_uid = obj.parent.session_uid if obj.parent else None
+    _known_objects[uid] = obj
+    if uid in _known_parents:
+        old_uid = _known_parents[uid]
+        if old_uid == parent_uid:
+            return False
+        if old_uid is not None:
+            _known_children.get(old_uid, set()).discard(uid)
+    _known_parents[uid] = parent_uid
+    if parent_uid is not None:
+        _known_children.setdefault(parent_uid, set()).add(uid)
+    return True
+
+
+def seed_known_parents():
+    _known_parents.clear()
+    _known_children.clear()
+    _known_objects.clear()
+    for obj in bpy.data.objects:
+        remember_parent(obj)
+
+
+def known_object(uid):
+    """Return the live Object for uid, or None if it was deleted."""
+    obj = _known_objects.get(uid)
+    try:
+        if obj is not None and obj.session_uid == uid:
+            return obj
+    except ReferenceError:
+        pass
+    return None
+
+
+def known_subtree(obj):
+    """obj and its descendants, walked through the tracked children map."""
+    result, seen = [], set()
+    stack = [obj.session_uid]
+    while stack:
+        uid = stack.pop()
+        if uid in seen:
+            continue
+        seen.add(uid)
+        o = known_object(uid)
+        if o is None:
+            continue
+        result.append(o)
+        stack.extend(_known_children.get(uid, ()))
+    return result
+
+
+def file_reparented_objects(scene, depsgraph):
+    """depsgraph_update_post handler relinking newly parented subtrees."""
+    reparented = []
+    for update in depsgraph.updates:
+        obj = update.id.original
+        if not isinstance(obj, bpy.types.Object):
+            continue
+        if remember_parent(obj) and obj.parent:
+            reparented.append(obj)
+
+    for obj in reparented:
+        target = hierarchy_collection(obj)
+        if target is None:
+            continue
+        for o in known_subtree(obj):
+            if list(o.users_collection) == [target]:
+                continue
+            for col in o.users_collection:
+                if col != target:
+                    col.objects.unlink(o)
+            if o.name not in target.objects:
+                target.objects.link(o)
+
+
+def is_watching():
+    return file_reparented_objects in bpy.app.handlers.depsgraph_update_post
+
+
+def stop_watching():
+    if is_watching():
+        bpy.app.handlers.depsgraph_update_post.remove(file_reparented_objects)
+    _known_parents.clear()
+    _known_children.clear()
+    _known_objects.clear()
+
+
+@persistent
+def reseed_after_undo(*_args):
+    """Undo/redo invalidates the stored Object references; track afresh."""
+    if is_watching():
+        seed_known_parents()
+
+
+class OBJECT_OT_toggle_hierarchy_collection_watch(bpy.types.Operator):
+    """Keep objects parented into a filed hierarchy in their root's collection"""
+    bl_idname = "object.toggle_hierarchy_collection_watch"
+    bl_label = "Toggle Hierarchy Collection Watch"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        if is_watching():
+            stop_watching()
+            self.report({"INFO"}, "Hierarchy collection watch stopped")
+            return {"FINISHED"}
+
+        # Seed once so only parent changes made from now on are acted upon
+        seed_known_parents()
+        bpy.app.handlers.depsgraph_update_post.append(file_reparented_objects)
+        self.report({"INFO"}, "Hierarchy collection watch started")
+        return {"FINISHED"}
 
 def menu_func(self, context):
     if context.mode == "OBJECT":
@@ -125,10 +507,20 @@ def menu_func(self, context):
             OBJECT_OT_move_hierarchy_to_collection.bl_idname,
             icon="OUTLINER_COLLECTION",
         )
+        self.layout.operator(
+            OBJECT_OT_toggle_hierarchy_collection_culling.bl_idname,
+            icon="HIDE_ON" if _cull_state["running"] else "HIDE_OFF",
+        )
+        self.layout.operator(
+            OBJECT_OT_toggle_hierarchy_collection_watch.bl_idname,
+            icon="RADIOBUT_ON" if is_watching() else "RADIOBUT_OFF",
+        )
 
 
 classes = (
     OBJECT_OT_move_hierarchy_to_collection,
+    OBJECT_OT_toggle_hierarchy_collection_culling,
+    OBJECT_OT_toggle_hierarchy_collection_watch,
 )
 
 addon_keymaps = []
@@ -148,9 +540,23 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+    if reset_culling_on_load not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(reset_culling_on_load)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reseed_after_undo not in handlers:
+            handlers.append(reseed_after_undo)
 
 
 def unregister():
+    if _cull_state["running"]:
+        stop_culling()
+    if reset_culling_on_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(reset_culling_on_load)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reseed_after_undo in handlers:
+            handlers.remove(reseed_after_undo)
+    stop_watching()
+
     for km, kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
     addon_keymaps.clear()
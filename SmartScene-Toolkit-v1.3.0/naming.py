@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+"""Template-based naming for operators that create many objects.
+
+Copies made with ``obj.copy()`` come out as ``Cube.001``, ``Cube.002``...,
+names that say nothing about which hierarchy or side they belong to.
+``NameAllocator`` hands out unique names from a template such as
+``{root}_{side}_{n:04d}`` instead. It reads the names already in use once
+per operation, so renaming thousands of copies does not probe the
+collection for every candidate. Blender still gives each copy its
+temporary ``.001`` name first; only object names are templated, data
+copies keep Blender's names.
+
+Template fields:
+    name  -- the source object's name without ``.001`` / side suffix
+    root  -- the hierarchy root's name without ``.001`` / side suffix
+    side  -- ``.L`` / ``.R`` (or empty) for mirrored objects
+    n     -- running number, unique per formatted prefix
+"""
+
+import re
+from string import Formatter
+
+# Blender's ID name limit (MAX_ID_NAME - 2)
+MAX_NAME_LEN = 63
+
+_NUMBER_SUFFIX = re.compile(r"\.\d{3,}$")
+_SIDE_SUFFIX = re.compile(r"([._])([LRlr])$")
+_SIDE_FLIP = {"L": "R", "R": "L", "l": "r", "r": "l"}
+
+def strip_number(name):
+    """'Cube.004' -> 'Cube'"""
+    return _NUMBER_SUFFIX.sub("", name)
+
+def split_side(name):
+    """Split 'Arm.L.002' into ('Arm', '.L'). Side is '' when there is none."""
+    name = strip_number(name)
+    m = _SIDE_SUFFIX.search(name)
+    if not m:
+        return name, ""
+    return name[:m.start()], m.group(1) + m.group(2)
+
+def flip_side(side):
+    """'.L' -> '.R', '_r' -> '_l', '' -> ''"""
+    if not side:
+        return side
+    return side[:-1] + _SIDE_FLIP[side[-1]]
+
+def side_from_offset(offset):
+    """Blender's convention: +X is the character's left."""
+    if offset > 0:
+        return ".L"
+    if offset < 0:
+        return ".R"
+    return ""
+
+def template_error(template):
+    """Return an error message if template can't be formatted, else None."""
+    try:
+        template.format(name="a", root="a", side="", n=1)
+    except Exception as e:
+        return f"Invalid name template '{template}': {e}"
+    return None
+
+
+class NameAllocator:
+    """Reserve unique names for one ID collection (e.g. ``bpy.data.objects``).
+
+    The set of used names is read once; every reserved name is added to it,
+    and the next running number is remembered per prefix, so allocating K
+    names costs O(K) set lookups. To reserve a single name pass
+    ``indexed=False``: candidates are then looked up in the collection
+    directly instead of reading every name first.
+    """
+
+    def __init__(self, id_collection, template="{name}.{n:03d}", indexed=True):
+        self.id_collection = id_collection
+        self.template = template
+        self.indexed = indexed
+        self.used = set(id_collection.keys()) if indexed else set()
+        self.next_n = {}
+        self.numbered = any(field == "n" for _text, field, _spec, _conv in Formatter().parse(template))
+
+    def _format(self, template, fields, n):
+        """Format one candidate, trimming the longest of {name}/{root} until
+        the final name (suffix and actual n included) fits Blender's limit."""
+        candidate = template.format(n=n, **fields)
+        overflow = len(candidate.encode("utf-8")) - MAX_NAME_LEN
+        while overflow > 0:
+            key = max(("name", "root"), key=lambda k: len(fields[k]))
+            raw = fields[key].encode("utf-8")
+            if not raw:
+                break
+            fields = dict(fields, **{key: raw[:max(0, len(raw) - overflow)].decode("utf-8", "ignore")})
+            candidate = template.format(n=n, **fields)
+            overflow = len(candidate.encode("utf-8")) - MAX_NAME_LEN
+        return candidate
+
+    def in_use(self, name):
+        if name in self.used:
+            return True
+        return not self.indexed and self.id_collection.get(name) is not None
+
+    def reserve(self, name="", root="", side=""):
+        """Return a name from the template that is not in use and mark it used."""
+        fields = {"name": name, "root": root or name, "side": side}
+
+        if not self.numbered:
+            candidate = self._format(self.template, fields, 0)
+            if not self.in_use(candidate):
+                self.used.add(candidate)
+                return candidate
+            template = self.template + "_{n:03d}"
+        else:
+            template = self.template
+
+        prefix = template.format(n=0, **fields)
+        n = self.next_n.get(prefix, 1)
+        candidate = self._format(template, fields, n)
+        while self.in_use(candidate):
+            n += 1
+            candidate = self._format(template, fields, n)
+        self.next_n[prefix] = n + 1
+        self.used.add(candidate)
+        return candidate
+
+    def rename(self, id_block, name="", root="", side=""):
+        """Reserve a name and assign it to id_block, returning the final name."""
+        new_name = self.reserve(name=name, root=root, side=side)
+        old_name = id_block.name
+        id_block.name = new_name
+        # Blender may still adjust the name if the index went stale mid-operation
+        self.used.discard(old_name)
+        self.used.add(id_block.name)
+        return id_block.name
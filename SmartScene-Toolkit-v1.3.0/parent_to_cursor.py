@@ -19,6 +19,9 @@
 # ***** END GPL LICENSE BLOCK ****
 
 import bpy
+from mathutils import Matrix
+from .naming import NameAllocator, split_side, template_error
+from .hierarchy_utils import find_roots, build_children_index, drop_nested_roots
 
 bl_info = {
     "name": "🪄 SmartScene Toolkit - Create ECP (Empty Coordinate Parent)",
@@ -52,11 +55,22 @@ class OBJECT_OT_create_ecp(bpy.types.Operator):
     bl_label = "Parent to ECP (Empty Coordinate Parent)"
     bl_options = {'REGISTER', 'UNDO'}
 
+    name_template: bpy.props.StringProperty(
+        name="Name Template",
+        description="Name for the new ECP. Fields: {root}, {side}, {n}",
+        default="ECP_{root}{side}"
+    )
+
     def execute(self, context):
         selected = context.selected_objects
         if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
+
+        error = template_error(self.name_template)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
         
         root_objs = find_root_objects(selected)
         all_targets = collect_with_children_recursive(root_objs)
@@ -65,9 +79,17 @@ class OBJECT_OT_create_ecp(bpy.types.Operator):
         cursor_loc = context.scene.cursor.location.copy()
 
 
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=cursor_loc)
-        ecp = context.active_object
-        ecp.name = "ECP"
+        # Create the empty under its final name, so Blender has no collision to resolve
+        root_name, side = split_side(root_objs[0].name)
+        names = NameAllocator(bpy.data.objects, self.name_template, indexed=False)
+        ecp = bpy.data.objects.new(names.reserve(name="ECP", root=root_name, side=side), None)
+        ecp.empty_display_type = 'PLAIN_AXES'
+        ecp.location = cursor_loc
+        context.collection.objects.link(ecp)
+        for obj in selected:
+            obj.select_set(False)
+        ecp.select_set(True)
+        context.view_layer.objects.active = ecp
 
 
         if not ecp.users_collection:
@@ -89,13 +111,110 @@ class OBJECT_OT_create_ecp(bpy.types.Operator):
 
         return {'FINISHED'}
 
+def reparent_keep_transform(plan):
+    """Apply {obj: new_parent} while keeping every world matrix exactly.
+
+    All world matrices are read before any parent link is rewritten, so the
+    result doesn't depend on processing order and the cost stays linear.
+    """
+    worlds = {o: o.matrix_world.copy() for o in plan}
+    parent_worlds = {p: p.matrix_world.copy() for p in plan.values() if p}
+
+    for obj, new_parent in plan.items():
+        obj.parent = new_parent
+        if new_parent:
+            # world = parent_world @ parent_inverse @ basis, keep basis untouched
+            obj.matrix_parent_inverse = (parent_worlds[new_parent].inverted_safe()
+                                         @ worlds[obj] @ obj.matrix_basis.inverted_safe())
+        else:
+            obj.matrix_parent_inverse = Matrix.Identity(4)
+            obj.matrix_basis = worlds[obj]
+
+
+class OBJECT_OT_dissolve_ecp(bpy.types.Operator):
+    """Dissolve selected ECP empties or flatten selected hierarchies, keeping transforms"""
+    bl_idname = "object.dissolve_ecp_parent"
+    bl_label = "Dissolve ECP / Flatten Hierarchy"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('DISSOLVE', "Dissolve ECPs", "Remove selected empties and hand their children to the empty's parent"),
+            ('FLATTEN', "Flatten", "Limit selected hierarchies to a number of levels below the root"),
+        ],
+        default='DISSOLVE'
+    )
+
+    levels: bpy.props.IntProperty(
+        name="Levels",
+        description="Maximum depth below the root when flattening",
+        default=1,
+        min=1
+    )
+
+    def plan_dissolve(self, selected, children):
+        # Collection-instance empties are content, not ECPs
+        dissolve = {o for o in selected if o.type == 'EMPTY' and o.instance_type == 'NONE'}
+        plan = {}
+        for ecp in dissolve:
+            new_parent = ecp.parent
+            while new_parent in dissolve:
+                new_parent = new_parent.parent
+            for child in children.get(ecp, ()):
+                if child not in dissolve:
+                    plan[child] = new_parent
+        return plan, dissolve
+
+    def plan_flatten(self, selected, children):
+        plan = {}
+        # Roots nested under another root (through an unselected object) would
+        # overwrite that walk's anchors
+        for root in drop_nested_roots(find_roots(selected)):
+            # anchor: the ancestor at depth (levels - 1) that deeper objects move under
+            stack = [(root, 0, root)]
+            while stack:
+                obj, depth, anchor = stack.pop()
+                if depth == self.levels - 1:
+                    anchor = obj
+                elif depth > self.levels:
+                    plan[obj] = anchor
+                for child in children.get(obj, ()):
+                    stack.append((child, depth + 1, anchor))
+        return plan
+
+    def execute(self, context):
+        selected = context.selected_objects
+        if not selected:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        children = build_children_index(context.scene.objects)
+        dissolve = set()
+        if self.mode == 'DISSOLVE':
+            plan, dissolve = self.plan_dissolve(selected, children)
+            if not dissolve:
+                self.report({'WARNING'}, "No empties selected")
+                return {'CANCELLED'}
+        else:
+            plan = self.plan_flatten(selected, children)
+
+        reparent_keep_transform(plan)
+        if dissolve:
+            bpy.data.batch_remove(list(dissolve))
+
+        self.report({'INFO'}, f"Reparented {len(plan)} object(s), removed {len(dissolve)} empt{'y' if len(dissolve) == 1 else 'ies'}")
+        return {'FINISHED'}
+
 def menu_func(self, context):
     self.layout.operator(OBJECT_OT_create_ecp.bl_idname, icon='OUTLINER_OB_EMPTY')
+    self.layout.operator(OBJECT_OT_dissolve_ecp.bl_idname, icon='OUTLINER_OB_EMPTY')
 
 addon_keymaps = []
 
 def register():
     bpy.utils.register_class(OBJECT_OT_create_ecp)
+    bpy.utils.register_class(OBJECT_OT_dissolve_ecp)
     bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
 
     # Hotkey Registration:
@@ -113,6 +232,7 @@ def unregister():
     addon_keymaps.clear()
 
     bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    bpy.utils.unregister_class(OBJECT_OT_dissolve_ecp)
     bpy.utils.unregister_class(OBJECT_OT_create_ecp)
 
 if __name__ == "__main__":
@@ -31,33 +31,114 @@ bl_info = {
 }
 
 
-def try_outliner_jump(context):
-    """Try to jump to the active object in Outliner.
-    This is optional UX enhancement. If Outliner is not open, do nothing."""
-    for area in context.window.screen.areas:
+# Preferences are registered on the add-on package when bundled, or on this
+# module when installed as a single file.
+ADDON_ID = __package__ or __name__
+
+# Outliner lookup cache: screen pointer + area/region indices. Indices are
+# re-validated on use, so a stale entry is never dereferenced.
+_outliner_cache = {"screen": None, "area": -1, "region": -1}
+# Window waiting for a deferred reveal; repeated presses just overwrite it.
+_pending_reveal = {"window": None}
+
+
+class SmartScenePowerfulSelectPreferences(bpy.types.AddonPreferences):
+    bl_idname = ADDON_ID
+
+    show_outliner_popup: bpy.props.BoolProperty(
+        name="Warn When No Outliner Is Open",
+        description="Show a popup when Powerful Select can't find an Outliner to reveal the object in",
+        default=True
+    )
+
+    outliner_reveal_delay: bpy.props.FloatProperty(
+        name="Outliner Reveal Delay",
+        description="Seconds to wait before revealing in the Outliner; presses within this window are merged",
+        default=0.15,
+        min=0.0,
+        max=2.0,
+        subtype='TIME',
+        unit='TIME'
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "show_outliner_popup")
+        layout.prop(self, "outliner_reveal_delay")
+
+
+def get_preferences(context):
+    addon = context.preferences.addons.get(ADDON_ID)
+    return addon.preferences if addon else None
+
+
+def find_outliner(screen):
+    """Return (area, region) of the first Outliner in screen, or (None, None)."""
+    cache = _outliner_cache
+    if cache["screen"] == screen.as_pointer():
+        a_idx, r_idx = cache["area"], cache["region"]
+        areas = screen.areas
+        if 0 <= a_idx < len(areas) and areas[a_idx].type == 'OUTLINER':
+            regions = areas[a_idx].regions
+            if r_idx < len(regions) and regions[r_idx].type == 'WINDOW':
+                return areas[a_idx], regions[r_idx]
+
+    # Only hits are cached; a miss rescans next time so a newly opened
+    # Outliner is picked up right away.
+    for a_idx, area in enumerate(screen.areas):
         if area.type == 'OUTLINER':
-            for region in area.regions:
+            for r_idx, region in enumerate(area.regions):
                 if region.type == 'WINDOW':
-                    override = {
-                        'window': context.window,
-                        'screen': context.screen,
-                        'area': area,
-                        'region': region,
-                    }
-
-                    try:
-                        with context.temp_override(**override):
-                            bpy.ops.outliner.show_active()
-                    except Exception as e:
-                        print("Outliner jump failed:", e)
-                    return
-
-    # Outliner not found – non-blocking UX notification
-    context.window_manager.popup_menu(
-        lambda self, ctx: self.layout.label(text="Please open an Outliner to enable jump."),
-        title="Outliner Not Found",
-        icon='INFO'
-    )
+                    cache.update(screen=screen.as_pointer(), area=a_idx, region=r_idx)
+                    return area, region
+    return None, None
+
+
+def deferred_outliner_reveal():
+    """Timer callback: reveal the active object once for all merged presses."""
+    window_ptr = _pending_reveal["window"]
+    _pending_reveal["window"] = None
+
+    # The window may have been closed while the timer was pending
+    window = next((w for w in bpy.context.window_manager.windows if w.as_pointer() == window_ptr), None)
+    if window is None:
+        return None
+
+    area, region = find_outliner(window.screen)
+    if area is None:
+        return None
+
+    try:
+        with bpy.context.temp_override(window=window, screen=window.screen, area=area, region=region):
+            bpy.ops.outliner.show_active()
+    except Exception as e:
+        print("Outliner jump failed:", e)
+    return None
+
+
+def try_outliner_jump(context):
+    """Try to jump to the active object in Outliner.
+    This is optional UX enhancement. If Outliner is not open, do nothing.
+
+    The reveal itself runs on a short timer, so rapid repeated presses only
+    pay for one show_active over a large Outliner."""
+    area, _region = find_outliner(context.window.screen)
+    prefs = get_preferences(context)
+
+    if area is None:
+        # Outliner not found – non-blocking UX notification
+        if prefs is None or prefs.show_outliner_popup:
+            context.window_manager.popup_menu(
+                lambda self, ctx: self.layout.label(text="Please open an Outliner to enable jump."),
+                title="Outliner Not Found",
+                icon='INFO'
+            )
+        return
+
+    _pending_reveal["window"] = context.window.as_pointer()
+    if not bpy.app.timers.is_registered(deferred_outliner_reveal):
+        delay = prefs.outliner_reveal_delay if prefs else 0.15
+        bpy.app.timers.register(deferred_outliner_reveal, first_interval=delay)
 
 
 class OBJECT_OT_select_parent(bpy.types.Operator):
@@ -120,6 +201,7 @@ def menu_func(self, context):
         )
 
 classes = (
+    SmartScenePowerfulSelectPreferences,
     OBJECT_OT_select_parent,
     OBJECT_OT_powerful_select,
     OBJECT_MT_smartscene_powerful_select,
@@ -145,6 +227,9 @@ def register():
         addon_keymaps.extend([(km, kmi1), (km, kmi2)])
 
 def unregister():
+    if bpy.app.timers.is_registered(deferred_outliner_reveal):
+        bpy.app.timers.unregister(deferred_outliner_reveal)
+
     bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
 
     for km, kmi in addon_keymaps:
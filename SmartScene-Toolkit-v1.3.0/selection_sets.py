@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import bpy
+from bpy.app.handlers import persistent
+from .powerful_select import try_outliner_jump
+from .hierarchy_utils import find_roots
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Hierarchy Selection Sets",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Selection Sets",
+    "category": "Object",
+    "description": "Save and restore named selections of hierarchies"
+}
+
+# Hierarchy index cached between restores. It is dropped when an object's
+# parent changes (depsgraph), on undo/redo/file load, and rebuilt when the
+# view layer or its object count differs (objects added, deleted or excluded).
+_index_cache = {"view_layer": None, "count": -1, "children": None, "parents": None, "in_layer": None}
+
+def build_hierarchy_index(view_layer):
+    """One pass over the view layer: parent -> children map and the set of
+    objects that can be selected. Avoids per-root children_recursive scans."""
+    children, parents, in_layer = {}, {}, set()
+    for o in view_layer.objects:
+        in_layer.add(o)
+        parents[o] = o.parent
+        if o.parent:
+            children.setdefault(o.parent, []).append(o)
+    return children, parents, in_layer
+
+def get_hierarchy_index(view_layer):
+    """Return (children, in_layer), reusing the cached index when still valid."""
+    cache = _index_cache
+    count = len(view_layer.objects)
+    if cache["view_layer"] != view_layer.as_pointer() or cache["count"] != count:
+        children, parents, in_layer = build_hierarchy_index(view_layer)
+        cache.update(view_layer=view_layer.as_pointer(), count=count,
+                     children=children, parents=parents, in_layer=in_layer)
+    return cache["children"], cache["in_layer"]
+
+@persistent
+def invalidate_hierarchy_index(*_args):
+    _index_cache.update(view_layer=None, count=-1, children=None, parents=None, in_layer=None)
+
+@persistent
+def track_parent_changes(scene, depsgraph):
+    """Drop the cached index when an updated object is new to it or its parent changed."""
+    parents = _index_cache["parents"]
+    if parents is None:
+        return
+    for update in depsgraph.updates:
+        obj = update.id.original
+        if isinstance(obj, bpy.types.Object) and (obj not in parents or parents[obj] != obj.parent):
+            invalidate_hierarchy_index()
+            return
+
+INDEX_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, track_parent_changes),
+    (bpy.app.handlers.undo_post, invalidate_hierarchy_index),
+    (bpy.app.handlers.redo_post, invalidate_hierarchy_index),
+    (bpy.app.handlers.load_post, invalidate_hierarchy_index),
+)
+
+def expand_selection_set(sel_set, children):
+    """Return the roots of sel_set plus, if requested, all their descendants."""
+    roots = [item.obj for item in sel_set.roots if item.obj]
+    if not sel_set.include_descendants:
+        return roots
+
+    result, stack = [], list(roots)
+    while stack:
+        o = stack.pop()
+        result.append(o)
+        stack.extend(children.get(o, ()))
+    return result
+
+
+class SMARTSCENE_PG_selection_root(bpy.types.PropertyGroup):
+    obj: bpy.props.PointerProperty(type=bpy.types.Object)
+
+
+class SMARTSCENE_PG_selection_set(bpy.types.PropertyGroup):
+    roots: bpy.props.CollectionProperty(type=SMARTSCENE_PG_selection_root)
+    include_descendants: bpy.props.BoolProperty(name="Include Descendants", default=True)
+
+
+class OBJECT_OT_save_selection_set(bpy.types.Operator):
+    """Save the selected hierarchies as a named selection set"""
+    bl_idname = "object.save_selection_set"
+    bl_label = "Save Selection Set"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    set_name: bpy.props.StringProperty(name="Name", default="Selection Set")
+    include_descendants: bpy.props.BoolProperty(
+        name="Include Descendants",
+        description="Store only the hierarchy roots and expand to all descendants on restore",
+        default=True
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        sel = context.selected_objects
+        if not sel:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        sets = context.scene.smartscene_selection_sets
+        sel_set = sets.get(self.set_name)
+        if sel_set is None:
+            sel_set = sets.add()
+            sel_set.name = self.set_name
+        sel_set.roots.clear()
+        sel_set.include_descendants = self.include_descendants
+
+        stored = find_roots(sel) if self.include_descendants else sel
+        for o in stored:
+            sel_set.roots.add().obj = o
+
+        self.report({'INFO'}, f"Saved '{self.set_name}' with {len(stored)} root(s)")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_restore_selection_set(bpy.types.Operator):
+    """Select every object of a named selection set"""
+    bl_idname = "object.restore_selection_set"
+    bl_label = "Restore Selection Set"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    set_name: bpy.props.StringProperty(name="Name")
+    extend: bpy.props.BoolProperty(name="Extend", description="Add to the current selection", default=False)
+
+    def execute(self, context):
+        sel_set = context.scene.smartscene_selection_sets.get(self.set_name)
+        if sel_set is None:
+            self.report({'WARNING'}, f"Selection set '{self.set_name}' not found")
+            return {'CANCELLED'}
+
+        view_layer = context.view_layer
+        children, in_layer = get_hierarchy_index(view_layer)
+        objs = [o for o in expand_selection_set(sel_set, children) if o in in_layer]
+        if not objs:
+            self.report({'WARNING'}, f"Selection set '{self.set_name}' is empty")
+            return {'CANCELLED'}
+
+        if not self.extend:
+            for o in context.selected_objects:
+                o.select_set(False)
+        for o in objs:
+            o.select_set(True)
+
+        view_layer.objects.active = objs[0]
+        try_outliner_jump(context)
+
+        self.report({'INFO'}, f"Selected {len(objs)} object(s) from '{self.set_name}'")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_remove_selection_set(bpy.types.Operator):
+    """Remove a named selection set"""
+    bl_idname = "object.remove_selection_set"
+    bl_label = "Remove Selection Set"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    set_name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        sets = context.scene.smartscene_selection_sets
+        index = sets.find(self.set_name)
+        if index < 0:
+            self.report({'WARNING'}, f"Selection set '{self.set_name}' not found")
+            return {'CANCELLED'}
+        sets.remove(index)
+        return {'FINISHED'}
+
+
+class OBJECT_MT_smartscene_selection_sets(bpy.types.Menu):
+    """Named hierarchy selection sets"""
+    bl_idname = "OBJECT_MT_smartscene_selection_sets"
+    bl_label = "Selection Sets"
+
+    def draw(self, context):
+        layout = self.layout
+        for sel_set in context.scene.smartscene_selection_sets:
+            row = layout.row(align=True)
+            op = row.operator(OBJECT_OT_restore_selection_set.bl_idname, text=sel_set.name, icon='RESTRICT_SELECT_OFF')
+            op.set_name = sel_set.name
+            op = row.operator(OBJECT_OT_remove_selection_set.bl_idname, text="", icon='X')
+            op.set_name = sel_set.name
+        layout.separator()
+        layout.operator(OBJECT_OT_save_selection_set.bl_idname, text="Save Selection Set", icon='ADD')
+
+
+def menu_func(self, context):
+    if context.mode == "OBJECT":
+        self.layout.menu(OBJECT_MT_smartscene_selection_sets.bl_idname, icon='RESTRICT_SELECT_OFF')
+
+
+classes = (
+    SMARTSCENE_PG_selection_root,
+    SMARTSCENE_PG_selection_set,
+    OBJECT_OT_save_selection_set,
+    OBJECT_OT_restore_selection_set,
+    OBJECT_OT_remove_selection_set,
+    OBJECT_MT_smartscene_selection_sets,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.smartscene_selection_sets = bpy.props.CollectionProperty(type=SMARTSCENE_PG_selection_set)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+    for handlers, func in INDEX_HANDLERS:
+        handlers.append(func)
+
+def unregister():
+    for handlers, func in INDEX_HANDLERS:
+        if func in handlers:
+            handlers.remove(func)
+    invalidate_hierarchy_index()
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    del bpy.types.Scene.smartscene_selection_sets
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 Tianle Yuan
+
+# ***** BEGIN GPL LICENSE BLOCK ****
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ***** END GPL LICENSE BLOCK ****
+
+
+import os
+import bpy
+import numpy as np
+from mathutils import Matrix
+from .hierarchy_utils import find_roots, collect_recursive
+
+bl_info = {
+    "name": "🪄 SmartScene Toolkit - Transform Snapshots",
+    "author": "Tianle Yuan",
+    "version": (1, 0, 0),
+    "blender": (4, 4, 3),
+    "location": "Object Mode > Transform Snapshots",
+    "category": "Object",
+    "description": "Save and restore parent links and local matrices of selected hierarchies"
+}
+
+# In-memory snapshots: name -> {"names", "parents", "parent_inverse", "basis"}
+_snapshots = {}
+
+def take_snapshot(objs):
+    """Record parent links and local matrices of objs as compact arrays."""
+    objs = sorted(objs, key=lambda o: o.name)
+    return {
+        "names": np.array([o.name for o in objs], dtype=str),
+        "parents": np.array([o.parent.name if o.parent else "" for o in objs], dtype=str),
+        "parent_inverse": np.array([o.matrix_parent_inverse for o in objs], dtype=np.float32).reshape(-1, 4, 4),
+        "basis": np.array([o.matrix_basis for o in objs], dtype=np.float32).reshape(-1, 4, 4),
+    }
+
+def restore_snapshot(snapshot):
+    """Write a snapshot back. Parent links that change are cleared first and
+    only then assigned, so links swapped since the snapshot can't trip
+    Blender's loop check; local matrices don't depend on the parents' state.
+
+    Returns (restored, missing) counts.
+    """
+    objects = bpy.data.objects
+    entries = []
+    missing = 0
+    for name, parent_name, parent_inv, basis in zip(
+            snapshot["names"], snapshot["parents"], snapshot["parent_inverse"], snapshot["basis"]):
+        obj = objects.get(str(name))
+        if obj is None:
+            missing += 1
+            continue
+        parent = objects.get(str(parent_name)) if parent_name else None
+        entries.append((obj, parent, parent_inv, basis))
+
+    for obj, parent, _parent_inv, _basis in entries:
+        if obj.parent != parent:
+            obj.parent = None
+    for obj, parent, parent_inv, basis in entries:
+        if obj.parent != parent:
+            obj.parent = parent
+        obj.matrix_parent_inverse = Matrix(parent_inv.tolist())
+        obj.matrix_basis = Matrix(basis.tolist())
+    return len(entries), missing
+
+class OBJECT_OT_save_transform_snapshot(bpy.types.Operator):
+    """Snapshot parent links and local matrices of the selected hierarchies"""
+    bl_idname = "object.save_transform_snapshot"
+    bl_label = "Save Transform Snapshot"
+    bl_options = {'REGISTER'}
+
+    snapshot_name: bpy.props.StringProperty(name="Name", default="Snapshot")
+    filepath: bpy.props.StringProperty(
+        name="File",
+        description="Optional .npz file to also write the snapshot to",
+        subtype='FILE_PATH',
+        default=""
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        sel = context.selected_objects
+        if not sel:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        snapshot = take_snapshot(collect_recursive(find_roots(sel)))
+        _snapshots[self.snapshot_name] = snapshot
+
+        if self.filepath:
+            path = bpy.path.abspath(self.filepath)
+            if not path.endswith(".npz"):
+                path += ".npz"
+            try:
+                np.savez_compressed(path, **snapshot)
+            except OSError as e:
+                self.report({'ERROR'}, f"Snapshot '{self.snapshot_name}' kept in memory, but could not be written: {e}")
+                return {'FINISHED'}
+
+        self.report({'INFO'}, f"Saved snapshot '{self.snapshot_name}' of {len(snapshot['names'])} object(s)")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_load_transform_snapshot(bpy.types.Operator):
+    """Load a transform snapshot from an .npz file"""
+    bl_idname = "object.load_transform_snapshot"
+    bl_label = "Load Transform Snapshot"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        try:
+            with np.load(path) as data:
+                snapshot = {key: data[key] for key in ("names", "parents", "parent_inverse", "basis")}
+        except (OSError, KeyError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not load snapshot: {e}")
+            return {'CANCELLED'}
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        _snapshots[name] = snapshot
+        self.report({'INFO'}, f"Loaded snapshot '{name}' of {len(snapshot['names'])} object(s)")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_restore_transform_snapshot(bpy.types.Operator):
+    """Restore parent links and local matrices from a snapshot"""
+    bl_idname = "object.restore_transform_snapshot"
+    bl_label = "Restore Transform Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    snapshot_name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        snapshot = _snapshots.get(self.snapshot_name)
+        if snapshot is None:
+            self.report({'WARNING'}, f"Snapshot '{self.snapshot_name}' not found")
+            return {'CANCELLED'}
+
+        restored, missing = restore_snapshot(snapshot)
+        if missing:
+            self.report({'WARNING'}, f"Restored {restored} object(s), {missing} no longer exist")
+        else:
+            self.report({'INFO'}, f"Restored {restored} object(s)")
+        return {'FINISHED'}
+
+
+class OBJECT_MT_smartscene_transform_snapshots(bpy.types.Menu):
+    """Transform snapshots of selected hierarchies"""
+    bl_idname = "OBJECT_MT_smartscene_transform_snapshots"
+    bl_label = "Transform Snapshots"
+
+    def draw(self, context):
+        layout = self.layout
+        for name in _snapshots:
+            op = layout.operator(OBJECT_OT_restore_transform_snapshot.bl_idname, text=f"Restore {name}", icon='LOOP_BACK')
+            op.snapshot_name = name
+        if _snapshots:
+            layout.separator()
+        layout.operator(OBJECT_OT_save_transform_snapshot.bl_idname, icon='ADD')
+        layout.operator(OBJECT_OT_load_transform_snapshot.bl_idname, icon='FILE_FOLDER')
+
+
+def menu_func(self, context):
+    if context.mode == "OBJECT":
+        self.layout.menu(OBJECT_MT_smartscene_transform_snapshots.bl_idname, icon='LOOP_BACK')
+
+
+classes = (
+    OBJECT_OT_save_transform_snapshot,
+    OBJECT_OT_load_transform_snapshot,
+    OBJECT_OT_restore_transform_snapshot,
+    OBJECT_MT_smartscene_transform_snapshots,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.VIEW3D_MT_object_context_menu.append(menu_func)
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    _snapshots.clear()
+
+if __name__ == "__main__":
+    register()